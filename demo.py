@@ -5,22 +5,131 @@ Shows end-to-end workflow for creating a full epic ticket set
 """
 
 import sys
-import json
-from pathlib import Path
+import io
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent / 'utils'))
+from utils.json_io import output_path, write_json_records
+from utils.ticket_generator import PRIORITY_TABLE, Ticket, TicketGenerator
 
-from ticket_generator import TicketGenerator
+# Shared generator instance used by all demos
+GENERATOR = TicketGenerator()
 
+# Output formatting
+SEP = "=" * 70
+DASH = "-" * 70
+TICKET_FMT = "\n{i}. [{ticket.priority}] {ticket.type}\n   {ticket.summary}"
+TICKET_DETAIL_FMT = (
+    "\n📋 Ticket Type: {ticket.type}\n"
+    "🎯 Priority: {ticket.priority}\n"
+    "📝 Summary: {ticket.summary}\n"
+    "\n📄 Description:\n{ticket.description}"
+)
 
-def demo_single_ticket():
+# Demo fixtures for the "Medication Log" feature
+VIEW_COLUMNS = (
+    "Patient Name (Last Name, First Name)",
+    "Medication Name",
+    "Dosage",
+    "Frequency",
+    "Prescribed Date",
+    "Status",
+    "Actions (Edit, Discontinue, View History)"
+)
+
+ADD_FIELDS = (
+    {
+        "name": "Patient Name",
+        "type": "Searchable dropdown",
+        "mandatory": True
+    },
+    {
+        "name": "Medication Name",
+        "type": "Text field with autocomplete",
+        "mandatory": True
+    },
+    {
+        "name": "Dosage",
+        "type": "Text field",
+        "mandatory": True
+    },
+    {
+        "name": "Frequency",
+        "type": "Dropdown",
+        "mandatory": True,
+        "default": "Once daily"
+    },
+    {
+        "name": "Route",
+        "type": "Dropdown",
+        "mandatory": True
+    },
+    {
+        "name": "Prescribed Date",
+        "type": "Date picker",
+        "mandatory": True,
+        "default": "Today"
+    },
+    {
+        "name": "Prescribing Physician",
+        "type": "Searchable dropdown",
+        "mandatory": True
+    },
+    {
+        "name": "Special Instructions",
+        "type": "Large text field",
+        "mandatory": False
+    }
+)
+
+SEARCH_FIELDS = ("Patient Name", "Medication Name")
+
+FILTERS = (
+    {
+        "name": "Prescribed Date (From/To)",
+        "type": "Date range picker",
+        "default": "Empty"
+    },
+    {
+        "name": "Route",
+        "type": "Dropdown",
+        "default": "All"
+    },
+    {
+        "name": "Frequency",
+        "type": "Dropdown",
+        "default": "All"
+    },
+    {
+        "name": "Prescribing Physician",
+        "type": "Searchable dropdown",
+        "default": "All"
+    }
+)
+
+
+def buffered_output(func):
+    """Collect a demo's printed output and emit it with a single write"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@buffered_output
+def demo_single_ticket(generator: TicketGenerator = GENERATOR):
     """Demo: Create a single ticket"""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("DEMO 1: Create a Single Ticket")
-    print("=" * 70)
-    
-    generator = TicketGenerator()
+    print(SEP)
     
     # Generate a "View Table Data" ticket
     summary = generator.generate_summary(
@@ -33,40 +142,24 @@ def demo_single_ticket():
         ticket_type="view_table_data",
         feature_name="Medication Log",
         tab_name="Active Medications",
-        columns=[
-            "Patient Name (Last Name, First Name)",
-            "Medication Name",
-            "Dosage",
-            "Frequency",
-            "Prescribed Date",
-            "Status",
-            "Actions (Edit, Discontinue, View History)"
-        ],
+        columns=VIEW_COLUMNS,
         facility_scope="facility-specific"
     )
     
-    priority = generator.suggest_priority("view_table_data")
+    priority = PRIORITY_TABLE["view_table_data"]
     
-    print(f"\n📋 Ticket Type: Story")
-    print(f"🎯 Priority: {priority}")
-    print(f"📝 Summary: {summary}")
-    print(f"\n📄 Description:\n{description}")
+    ticket = Ticket("Story", summary, description, priority)
+    print(TICKET_DETAIL_FMT.format(ticket=ticket))
     
-    return {
-        "type": "Story",
-        "summary": summary,
-        "description": description,
-        "priority": priority
-    }
+    return ticket
 
 
-def demo_epic_generation():
+@buffered_output
+def demo_epic_generation(generator: TicketGenerator = GENERATOR):
     """Demo: Generate a full epic ticket set"""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("DEMO 2: Generate Full Epic Ticket Set")
-    print("=" * 70)
-    
-    generator = TicketGenerator()
+    print(SEP)
     
     # Generate tickets for "Medication Log" feature
     tickets = generator.generate_epic_tickets(
@@ -78,24 +171,21 @@ def demo_epic_generation():
     )
     
     print(f"\n✅ Generated {len(tickets)} tickets:")
-    print("\n" + "-" * 70)
+    print("\n" + DASH)
     
-    for i, ticket in enumerate(tickets, 1):
-        print(f"\n{i}. [{ticket['priority']}] {ticket['type']}")
-        print(f"   {ticket['summary']}")
+    print("\n".join(TICKET_FMT.format(i=i, ticket=ticket) for i, ticket in enumerate(tickets, 1)))
     
-    print("\n" + "-" * 70)
+    print("\n" + DASH)
     
     return tickets
 
 
-def demo_custom_fields():
+@buffered_output
+def demo_custom_fields(generator: TicketGenerator = GENERATOR):
     """Demo: Create ticket with custom fields"""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("DEMO 3: Create Ticket with Custom Fields")
-    print("=" * 70)
-    
-    generator = TicketGenerator()
+    print(SEP)
     
     # Generate "Add Entity" ticket with specific fields
     summary = generator.generate_summary(
@@ -107,75 +197,24 @@ def demo_custom_fields():
     description = generator.generate_description(
         ticket_type="add_entity",
         entity_name="medication",
-        fields=[
-            {
-                "name": "Patient Name",
-                "type": "Searchable dropdown",
-                "mandatory": True
-            },
-            {
-                "name": "Medication Name",
-                "type": "Text field with autocomplete",
-                "mandatory": True
-            },
-            {
-                "name": "Dosage",
-                "type": "Text field",
-                "mandatory": True
-            },
-            {
-                "name": "Frequency",
-                "type": "Dropdown",
-                "mandatory": True,
-                "default": "Once daily"
-            },
-            {
-                "name": "Route",
-                "type": "Dropdown",
-                "mandatory": True
-            },
-            {
-                "name": "Prescribed Date",
-                "type": "Date picker",
-                "mandatory": True,
-                "default": "Today"
-            },
-            {
-                "name": "Prescribing Physician",
-                "type": "Searchable dropdown",
-                "mandatory": True
-            },
-            {
-                "name": "Special Instructions",
-                "type": "Large text field",
-                "mandatory": False
-            }
-        ],
+        fields=ADD_FIELDS,
         facility_scope="facility-specific"
     )
     
-    priority = generator.suggest_priority("add_entity")
+    priority = PRIORITY_TABLE["add_entity"]
     
-    print(f"\n📋 Ticket Type: Story")
-    print(f"🎯 Priority: {priority}")
-    print(f"📝 Summary: {summary}")
-    print(f"\n📄 Description:\n{description}")
+    ticket = Ticket("Story", summary, description, priority)
+    print(TICKET_DETAIL_FMT.format(ticket=ticket))
     
-    return {
-        "type": "Story",
-        "summary": summary,
-        "description": description,
-        "priority": priority
-    }
+    return ticket
 
 
-def demo_search_filter():
+@buffered_output
+def demo_search_filter(generator: TicketGenerator = GENERATOR):
     """Demo: Create search and filter ticket"""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("DEMO 4: Create Search & Filter Ticket")
-    print("=" * 70)
-    
-    generator = TicketGenerator()
+    print(SEP)
     
     summary = generator.generate_summary(
         ticket_type="search_filter",
@@ -187,77 +226,46 @@ def demo_search_filter():
         ticket_type="search_filter",
         feature_name="Medication Log",
         tab_name="Active Medications",
-        search_fields=["Patient Name", "Medication Name"],
-        filters=[
-            {
-                "name": "Prescribed Date (From/To)",
-                "type": "Date range picker",
-                "default": "Empty"
-            },
-            {
-                "name": "Route",
-                "type": "Dropdown",
-                "default": "All"
-            },
-            {
-                "name": "Frequency",
-                "type": "Dropdown",
-                "default": "All"
-            },
-            {
-                "name": "Prescribing Physician",
-                "type": "Searchable dropdown",
-                "default": "All"
-            }
-        ]
+        search_fields=SEARCH_FIELDS,
+        filters=FILTERS
     )
     
-    priority = generator.suggest_priority("search_filter")
+    priority = PRIORITY_TABLE["search_filter"]
     
-    print(f"\n📋 Ticket Type: Story")
-    print(f"🎯 Priority: {priority}")
-    print(f"📝 Summary: {summary}")
-    print(f"\n📄 Description:\n{description}")
+    ticket = Ticket("Story", summary, description, priority)
+    print(TICKET_DETAIL_FMT.format(ticket=ticket))
     
-    return {
-        "type": "Story",
-        "summary": summary,
-        "description": description,
-        "priority": priority
-    }
+    return ticket
 
 
-def export_all_demos():
-    """Export all demo tickets to JSON file"""
-    print("\n" + "=" * 70)
+@buffered_output
+def export_all_demos(all_tickets: List[Ticket]) -> str:
+    """Export the collected demo tickets to JSON file"""
+    print("\n" + SEP)
     print("EXPORTING ALL DEMO TICKETS")
-    print("=" * 70)
-    
-    all_tickets = []
-    
-    # Run all demos and collect tickets
-    all_tickets.append(demo_single_ticket())
-    all_tickets.extend(demo_epic_generation())
-    all_tickets.append(demo_custom_fields())
-    all_tickets.append(demo_search_filter())
+    print(SEP)
     
     # Export to file
-    output_file = "/mnt/user-data/outputs/medication-log-tickets.json"
-    
-    export_data = {
-        "project": "VDB",
-        "epic_name": "Medication Log",
-        "total_tickets": len(all_tickets),
-        "tickets": all_tickets,
-        "metadata": {
-            "generated_by": "JIRA Ticket Automation System",
-            "date": "2026-02-12",
-            "based_on_standards": "VDB-JIRA-Ticket-Standards.md"
+    output_file = output_path("medication-log-tickets.json")
+    
+    # Stream tickets one at a time rather than serializing the whole document
+    write_json_records(
+        output_file,
+        head={
+            "project": "VDB",
+            "epic_name": "Medication Log",
+            "total_tickets": len(all_tickets)
+        },
+        key="tickets",
+        records=all_tickets,
+        tail={
+            "metadata": {
+                "generated_by": "JIRA Ticket Automation System",
+                "date": "2026-02-12",
+                "based_on_standards": "VDB-JIRA-Ticket-Standards.md"
+            }
         }
-    }
-    
-    with open(output_file, 'w') as f:
-        json.dump(export_data, f, indent=2)
+    )
     
     print(f"\n✅ Exported {len(all_tickets)} tickets to:")
     print(f"   {output_file}")
@@ -272,33 +280,70 @@ def export_all_demos():
     return output_file
 
 
-def main():
+# Demos in display/export order
+DEMOS = (demo_single_ticket, demo_epic_generation, demo_custom_fields, demo_search_filter)
+
+
+def _run_captured(demo):
+    """Run a demo in a worker process, returning its printed output and tickets"""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = demo()
+    return buf.getvalue(), result
+
+
+def run_demos(parallel: bool = False) -> List[Ticket]:
+    """Run each demo once and collect its tickets for export"""
+    if parallel:
+        sys.stdout.flush()
+        with ProcessPoolExecutor(max_workers=len(DEMOS)) as executor:
+            outputs = list(executor.map(_run_captured, DEMOS))
+        
+        # Print after all workers finish so demo output stays in order
+        sys.stdout.write("".join(output for output, _ in outputs))
+        results = [result for _, result in outputs]
+    else:
+        results = [demo() for demo in DEMOS]
+    
+    all_tickets = []
+    for result in results:
+        if isinstance(result, list):
+            all_tickets.extend(result)
+        else:
+            all_tickets.append(result)
+    return all_tickets
+
+
+def main(parallel: bool = False):
     """Run all demos"""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("JIRA TICKET AUTOMATION - DEMO SUITE")
-    print("=" * 70)
+    print(SEP)
     print("\nThis demo shows how to generate tickets for a new 'Medication Log' feature")
     
-    # Run individual demos
-    demo_single_ticket()
-    demo_epic_generation()
-    demo_custom_fields()
-    demo_search_filter()
+    all_tickets = run_demos(parallel)
     
     # Export everything
-    output_file = export_all_demos()
+    output_file = export_all_demos(all_tickets)
     
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("NEXT STEPS")
-    print("=" * 70)
+    print(SEP)
     print("\n1. Review the generated tickets:")
     print(f"   cat {output_file}")
     print("\n2. Test with dry-run:")
     print(f"   python3 scripts/push_to_jira.py {output_file} --dry-run")
     print("\n3. Create in JIRA (when ready):")
     print(f"   python3 scripts/push_to_jira.py {output_file} --epic-key VDB-XXXX")
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run the ticket generation demos")
+    parser.add_argument('--parallel', action='store_true',
+                       help="Run the demos in separate worker processes")
+    
+    args = parser.parse_args()
+    main(parallel=args.parallel)
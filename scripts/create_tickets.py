@@ -6,13 +6,62 @@ Command-line interface for creating VDB project tickets
 
 import sys
 import os
-import json
+import functools
+from collections import deque
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+# Make the project root importable when run as a script
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from ticket_generator import TicketGenerator
+from utils.json_io import OUTPUT_DIR, output_path, write_json
+from utils.ticket_generator import PRIORITY_TABLE, Ticket, TicketGenerator
+
+# Ticket types offered by the single-ticket wizard, in menu order
+TICKET_TYPES = (
+    ("view_table_data", "View Table Data"),
+    ("add_entity", "Add Entity/Record"),
+    ("perform_actions", "Perform Actions"),
+    ("search_filter", "Search & Filter"),
+    ("download", "Download Data"),
+    ("upload_csv", "Upload CSV"),
+    ("backend_architecture", "Backend Architecture"),
+    ("rbac_permissions", "RBAC Permissions"),
+    ("nav_menu", "Navigation Menu"),
+    ("edge_cases", "Edge Cases"),
+    ("generic_story", "Generic Story")
+)
+
+# Ticket types that prompt for a tab name / FE-BE scope
+NEEDS_TAB = frozenset({"view_table_data", "search_filter", "perform_actions"})
+NEEDS_SCOPE = frozenset({"backend_architecture", "nav_menu", "rbac_permissions"})
+
+# First characters accepted as "yes" (y/yes, t/true, 1)
+YES_PREFIXES = frozenset("yYtT1")
+
+
+@functools.lru_cache(maxsize=256)
+def format_prompt(prompt: str, default: str = None) -> str:
+    """Build the text prompt shown by get_input"""
+    if default:
+        return f"\n{prompt} [{default}]: "
+    return f"\n{prompt}: "
+
+
+@functools.lru_cache(maxsize=256)
+def format_yes_no_prompt(prompt: str, default: bool) -> str:
+    """Build the prompt shown by get_yes_no"""
+    return f"\n{prompt} ({'Y/n' if default else 'y/N'}): "
+
+
+def enable_line_editing():
+    """Set up readline line editing for interactive prompts"""
+    try:
+        import readline
+    except ImportError:  # Not available on all platforms
+        return
+    readline.parse_and_bind("tab: complete")
 
 
 class TicketCreatorCLI:
@@ -20,9 +69,29 @@ class TicketCreatorCLI:
     
     def __init__(self):
         self.generator = TicketGenerator(
-            historical_data_path="/mnt/user-data/outputs/historical-tickets-data.json"
+            # Read-only path: the output directory is only created when exporting
+            historical_data_path=str(OUTPUT_DIR / "historical-tickets-data.json")
         )
-        self.tickets_to_create = []
+        self.tickets_to_create = deque()
+        self.interactive = sys.stdin.isatty()
+        self.scripted_input = None
+        
+        if self.interactive:
+            enable_line_editing()
+    
+    def read_line(self, prompt: str = "") -> str:
+        """Read one line of input; piped stdin is read once and replayed line by line"""
+        if self.interactive:
+            return input(prompt)
+        
+        if self.scripted_input is None:
+            self.scripted_input = deque(sys.stdin.read().splitlines())
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        if not self.scripted_input:
+            raise EOFError("EOF when reading a line")
+        return self.scripted_input.popleft()
     
     def print_header(self, text: str):
         """Print formatted header"""
@@ -43,7 +112,7 @@ class TicketCreatorCLI:
             for i, option in enumerate(options, 1):
                 print(f"  {i}. {option}")
             while True:
-                choice = input(f"\nEnter choice (1-{len(options)}): ").strip()
+                choice = self.read_line(f"\nEnter choice (1-{len(options)}): ").strip()
                 try:
                     idx = int(choice) - 1
                     if 0 <= idx < len(options):
@@ -52,48 +121,28 @@ class TicketCreatorCLI:
                     pass
                 print("Invalid choice. Please try again.")
         else:
-            prompt_text = f"\n{prompt}"
-            if default:
-                prompt_text += f" [{default}]"
-            prompt_text += ": "
-            
-            value = input(prompt_text).strip()
+            value = self.read_line(format_prompt(prompt, default)).strip()
             return value if value else default
     
     def get_yes_no(self, prompt: str, default: bool = True) -> bool:
         """Get yes/no input"""
-        default_text = "Y/n" if default else "y/N"
-        response = input(f"\n{prompt} ({default_text}): ").strip().lower()
+        response = self.read_line(format_yes_no_prompt(prompt, default)).strip()
         
         if not response:
             return default
-        return response in ['y', 'yes', 'true', '1']
+        return response[0] in YES_PREFIXES
     
     def create_single_ticket(self):
         """Interactive wizard for creating a single ticket"""
         self.print_header("CREATE SINGLE TICKET")
         
         # Select ticket type
-        ticket_types = [
-            ("view_table_data", "View Table Data"),
-            ("add_entity", "Add Entity/Record"),
-            ("perform_actions", "Perform Actions"),
-            ("search_filter", "Search & Filter"),
-            ("download", "Download Data"),
-            ("upload_csv", "Upload CSV"),
-            ("backend_architecture", "Backend Architecture"),
-            ("rbac_permissions", "RBAC Permissions"),
-            ("nav_menu", "Navigation Menu"),
-            ("edge_cases", "Edge Cases"),
-            ("generic_story", "Generic Story")
-        ]
-        
         print("\nSelect ticket type:")
-        for i, (key, label) in enumerate(ticket_types, 1):
+        for i, (key, label) in enumerate(TICKET_TYPES, 1):
             print(f"  {i}. {label}")
         
-        choice = int(input(f"\nEnter choice (1-{len(ticket_types)}): ").strip()) - 1
-        ticket_type_key, ticket_type_label = ticket_types[choice]
+        choice = int(self.read_line(f"\nEnter choice (1-{len(TICKET_TYPES)}): ").strip()) - 1
+        ticket_type_key, ticket_type_label = TICKET_TYPES[choice]
         
         # Get common fields
         feature_name = self.get_input("Feature/Epic name", "My Feature")
@@ -101,7 +150,7 @@ class TicketCreatorCLI:
         # Type-specific fields
         kwargs = {"feature_name": feature_name}
         
-        if ticket_type_key in ["view_table_data", "search_filter", "perform_actions"]:
+        if ticket_type_key in NEEDS_TAB:
             tab_name = self.get_input("Tab name (if applicable)", feature_name)
             kwargs["tab_name"] = tab_name
         
@@ -109,7 +158,7 @@ class TicketCreatorCLI:
             entity_name = self.get_input("Entity name (e.g., 'patient', 'claim')", "record")
             kwargs["entity_name"] = entity_name
         
-        if ticket_type_key in ["backend_architecture", "nav_menu", "rbac_permissions"]:
+        if ticket_type_key in NEEDS_SCOPE:
             scope = self.get_input("Scope (FE/BE/Full-stack)", "Full-stack", ["FE", "BE", "Full-stack"])
             if scope != "Full-stack":
                 kwargs["scope"] = scope
@@ -117,7 +166,7 @@ class TicketCreatorCLI:
         # Generate ticket
         summary = self.generator.generate_summary(ticket_type_key, **kwargs)
         description = self.generator.generate_description(ticket_type_key, **kwargs)
-        priority = self.generator.suggest_priority(ticket_type_key)
+        priority = PRIORITY_TABLE[ticket_type_key]
         
         # Allow user to override
         priority = self.get_input("Priority", priority, ["Highest", "High", "Medium", "Low"])
@@ -131,12 +180,7 @@ class TicketCreatorCLI:
         
         # Confirm
         if self.get_yes_no("Add this ticket to batch?", True):
-            self.tickets_to_create.append({
-                "type": "Story",
-                "summary": summary,
-                "description": description,
-                "priority": priority
-            })
+            self.tickets_to_create.append(Ticket("Story", summary, description, priority))
             print(f"\n✅ Ticket added to batch ({len(self.tickets_to_create)} total)")
         else:
             print("\n❌ Ticket discarded")
@@ -157,7 +201,7 @@ class TicketCreatorCLI:
         if self.get_yes_no("Does this feature have tabs/sections?", False):
             print("\nEnter tab names (one per line, empty line to finish):")
             while True:
-                tab = input("  Tab name: ").strip()
+                tab = self.read_line("  Tab name: ").strip()
                 if not tab:
                     break
                 tabs.append(tab)
@@ -173,8 +217,10 @@ class TicketCreatorCLI:
         
         # Preview
         self.print_section(f"GENERATED {len(tickets)} TICKETS")
-        for i, ticket in enumerate(tickets, 1):
-            print(f"\n{i}. [{ticket['priority']}] {ticket['summary']}")
+        print("\n".join(
+            f"\n{i}. [{ticket.priority}] {ticket.summary}"
+            for i, ticket in enumerate(tickets, 1)
+        ))
         
         # Confirm
         if self.get_yes_no(f"\nAdd all {len(tickets)} tickets to batch?", True):
@@ -191,8 +237,10 @@ class TicketCreatorCLI:
         
         self.print_header(f"BATCH REVIEW ({len(self.tickets_to_create)} tickets)")
         
-        for i, ticket in enumerate(self.tickets_to_create, 1):
-            print(f"\n{i}. [{ticket['priority']}] {ticket['summary']}")
+        print("\n".join(
+            f"\n{i}. [{ticket.priority}] {ticket.summary}"
+            for i, ticket in enumerate(self.tickets_to_create, 1)
+        ))
     
     def export_batch(self):
         """Export batch to JSON file"""
@@ -201,21 +249,20 @@ class TicketCreatorCLI:
             return
         
         filename = self.get_input("Output filename", "tickets_batch.json")
-        filepath = f"/mnt/user-data/outputs/{filename}"
+        filepath = output_path(filename)
         
-        with open(filepath, 'w') as f:
-            json.dump({
-                "tickets": self.tickets_to_create,
-                "count": len(self.tickets_to_create),
-                "project": "VDB"
-            }, f, indent=2)
+        write_json(filepath, {
+            "tickets": list(self.tickets_to_create),
+            "count": len(self.tickets_to_create),
+            "project": "VDB"
+        })
         
         print(f"\n✅ Exported {len(self.tickets_to_create)} tickets to {filepath}")
     
     def clear_batch(self):
         """Clear the ticket batch"""
         if self.get_yes_no(f"Clear all {len(self.tickets_to_create)} tickets from batch?", False):
-            self.tickets_to_create = []
+            self.tickets_to_create.clear()
             print("\n✅ Batch cleared")
     
     def main_menu(self):
@@ -234,7 +281,7 @@ class TicketCreatorCLI:
             print("5. Clear batch")
             print("6. Exit")
             
-            choice = input("\nEnter choice (1-6): ").strip()
+            choice = self.read_line("\nEnter choice (1-6): ").strip()
             
             if choice == "1":
                 self.create_single_ticket()
@@ -4,70 +4,221 @@ Meeting Transcript Processor
 Extracts structured requirements from unstructured meeting transcripts
 """
 
-import json
+import copy
+import functools
+import glob
+import io
+import os
 import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Make the project root importable when run as a script
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.json_io import write_json
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional
+    re2 = None
+
+# Set TRANSCRIPT_REGEX_ENGINE=re2 to scan with RE2's linear-time engine (needs google-re2)
+USE_RE2 = re2 is not None and os.environ.get("TRANSCRIPT_REGEX_ENGINE", "").lower() == "re2"
+
+# Files --inputs treats as transcripts
+TRANSCRIPT_SUFFIX = ".txt"
+
+# Ad-hoc patterns used outside the extraction pattern table
+SENT_SPLIT_RE = re.compile(r'[.!?]')
+LIST_SPLIT_RE = re.compile(r'[,;]|\s+and\s+')
+ATTENDEE_SPLIT_RE = re.compile(r'[,;]')
+DATE_RE = re.compile(r"(?:date|meeting)\s*:\s*(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE)
+ATTENDEES_RE = re.compile(r"(?:attendees|participants)\s*:\s*([^\n]+)", re.IGNORECASE)
+# Priority cues by level; run against the lowercased transcript
+PRIORITY_RE = re.compile(r"(highest|critical|urgent)|(high priority|important)|(low priority)")
+PRIORITY_LEVELS = (None, "Highest", "High", "Low")
+# Field notes meaning mandatory (anything else found, i.e. "optional", is not)
+MANDATORY_WORDS = frozenset({"required", "mandatory"})
+ENTITY_RE = re.compile(r"add\s+(?:a\s+|an\s+)?(\w+)", re.IGNORECASE)
+ACTION_ITEM_PATTERNS = [
+    re.compile(r"(?:action item|todo|task)\s*:\s*([^.]+)", re.IGNORECASE),
+    re.compile(r"([A-Z][^.]+?)\s+(?:will|should|needs? to)\s+([^.]+)\s+by\s+(\d{1,2}/\d{1,2}|\w+ \d{1,2})", re.IGNORECASE)
+]
+
+
+def keyword_regex(keywords: List[str]):
+    """Compile a substring-alternation regex that finds any keyword in one scan"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def read_transcript(path: str) -> str:
+    """Read a UTF-8 transcript (file, pipe or /dev/stdin), normalizing line endings to \\n"""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def split_list(text: str) -> List[str]:
+    """Split a spoken list on commas, semicolons and 'and' (plain str.split when only commas)"""
+    if "and" not in text and ";" not in text:
+        return text.split(",")
+    return LIST_SPLIT_RE.split(text)
+
+
+@functools.lru_cache(maxsize=256)
+def mandatory_regex(field_name: str):
+    """Compile (once per field name) the pattern finding a field's required/optional note"""
+    return re.compile(re.escape(field_name) + r"[^.]*?(required|mandatory|optional)", re.IGNORECASE)
+
+
+# Keyword checks run against the lowercased transcript
+RBAC_KEYWORDS_RE = keyword_regex(["permission", "access", "role", "only", "can view", "can edit", "restricted"])
+NAV_KEYWORDS_RE = keyword_regex(["menu", "navigation", "nav bar", "sidebar"])
+SEARCH_KEYWORDS_RE = keyword_regex(["search", "filter", "find"])
+ADD_KEYWORDS_RE = keyword_regex(["add", "create", "new", "form"])
+
+
+def compile_pattern(pattern: str):
+    """Compile a case-insensitive extraction pattern with RE2 when enabled, else re"""
+    pattern = "(?i)" + pattern
+    if USE_RE2:
+        try:
+            return re2.compile(pattern)
+        except re2.error:  # Unsupported syntax stays on re
+            pass
+    return re.compile(pattern)
+
+
+# Regex patterns for requirement extraction, by category
+EXTRACTION_PATTERN_SOURCES = {
+    # Feature/Epic patterns
+    "epic_name": [
+        r"(?:build|create|implement|develop)\s+(?:a\s+|an\s+|the\s+)?([A-Z][A-Za-z\s]+?)(?:\s+feature|\s+module|\s+system)",
+        r"(?:for\s+the\s+)([A-Z][A-Za-z\s]+?)(?:\s+feature|\s+module)"
+    ],
+    
+    # User story patterns
+    "user_story": [
+        r"(users?|nurses?|doctors?|admins?|staff)\s+(?:should\s+be\s+able\s+to|need\s+to|must|can)\s+([^.]+)",
+        r"(?:the\s+system|it)\s+(?:should|must|needs?\s+to)\s+(?:allow|enable|let)\s+(?:users?|nurses?|doctors?)\s+to\s+([^.]+)"
+    ],
+    
+    # Field specifications
+    "field_spec": [
+        r"(?:fields?\s+(?:for|include)|need|require|capture)\s+([^.]+?)\s*[-–—]\s*(all\s+)?(?:required|mandatory|optional)",
+        r"with\s+fields?\s+(?:for\s+)?([^.]+)"
+    ],
+    
+    # Table/UI patterns
+    "table_columns": [
+        r"(?:table|columns?)\s+(?:showing|with|for|displaying)\s+([^.]+)",
+        r"(?:show|display)\s+(?:columns?\s+for\s+)?([^.]+)\s+in\s+(?:the\s+)?table"
+    ],
+    
+    # Tab patterns
+    "tabs": [
+        r"(?:tabs?|sections?)\s*:\s*([^.]+)",
+        r"(?:split|divided)\s+into\s+(?:\d+\s+)?tabs?\s*:\s*([^.]+)"
+    ],
+    
+    # Priority indicators
+    "priority": [
+        r"(?:priority\s+is\s+|)(?:highest|high|medium|low|critical)",
+        r"(?:critical|urgent|important)\s+for"
+    ],
+    
+    # RBAC patterns
+    "rbac": [
+        r"(nurses?|doctors?|admins?|staff|users?)\s+can\s+([^.]+)",
+        r"only\s+(nurses?|doctors?|admins?)\s+(?:can|should|may)\s+([^.]+)"
+    ],
+    
+    # Validation rules
+    "validation": [
+        r"(?:should\s+not\s+allow|don't\s+allow|prevent|block)\s+([^.]+)",
+        r"(?:required\s+when|only\s+if|mandatory\s+when)\s+([^.]+)"
+    ]
+}
+
+# Compiled once per process and shared by every TranscriptProcessor
+EXTRACTION_PATTERNS = {key: [compile_pattern(pattern) for pattern in patterns]
+                       for key, patterns in EXTRACTION_PATTERN_SOURCES.items()}
+
+
+@dataclass(slots=True)
+class Field:
+    """A form field requested for an add/create ticket"""
+    name: str
+    type: str
+    mandatory: bool
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Field":
+        """Build a Field from its structured-JSON form"""
+        return cls(data["name"], data["type"], data["mandatory"])
+    
+    def to_dict(self) -> Dict:
+        """Plain-dict form, as TicketGenerator takes field specs"""
+        return {"name": self.name, "type": self.type, "mandatory": self.mandatory}
+
+
+@dataclass(slots=True)
+class TicketSpec:
+    """A ticket to generate, as extracted from the transcript"""
+    ticket_type: str
+    summary: str
+    priority: str = "High"
+    details: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TicketSpec":
+        """Build a TicketSpec from its structured-JSON form (field dicts become Field records)"""
+        details = dict(data.get("details", {}))
+        if "fields" in details:
+            details["fields"] = [Field.from_dict(f) for f in details["fields"]]
+        return cls(data["ticket_type"], data["summary"], data.get("priority", "High"), details)
+
+
+@dataclass(slots=True)
+class EpicData:
+    """An epic and the ticket specs extracted for it"""
+    epic_name: str
+    epic_description: str
+    priority: str
+    scope: str = "facility-specific"
+    tabs: List[str] = field(default_factory=list)
+    tickets: List[TicketSpec] = field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EpicData":
+        """Build an EpicData (and its TicketSpecs) from its structured-JSON form"""
+        return cls(
+            epic_name=data["epic_name"],
+            epic_description=data.get("epic_description", ""),
+            priority=data.get("priority", "Medium"),
+            scope=data.get("scope", "facility-specific"),
+            tabs=list(data.get("tabs", [])),
+            tickets=[TicketSpec.from_dict(ticket) for ticket in data.get("tickets", [])]
+        )
+
+
+def as_epic(epic) -> EpicData:
+    """Accept an EpicData, or its dict form from an (edited) _structured.json file"""
+    return epic if isinstance(epic, EpicData) else EpicData.from_dict(epic)
+
 
 class TranscriptProcessor:
     """Process meeting transcripts and extract requirements"""
     
-    def __init__(self):
-        self.extraction_patterns = self._load_extraction_patterns()
+    __slots__ = ("extraction_patterns",)
     
-    def _load_extraction_patterns(self) -> dict:
-        """Load regex patterns for requirement extraction"""
-        return {
-            # Feature/Epic patterns
-            "epic_name": [
-                r"(?:build|create|implement|develop)\s+(?:a\s+|an\s+|the\s+)?([A-Z][A-Za-z\s]+?)(?:\s+feature|\s+module|\s+system)",
-                r"(?:for\s+the\s+)([A-Z][A-Za-z\s]+?)(?:\s+feature|\s+module)"
-            ],
-            
-            # User story patterns
-            "user_story": [
-                r"(users?|nurses?|doctors?|admins?|staff)\s+(?:should\s+be\s+able\s+to|need\s+to|must|can)\s+([^.]+)",
-                r"(?:the\s+system|it)\s+(?:should|must|needs?\s+to)\s+(?:allow|enable|let)\s+(?:users?|nurses?|doctors?)\s+to\s+([^.]+)"
-            ],
-            
-            # Field specifications
-            "field_spec": [
-                r"(?:fields?\s+(?:for|include)|need|require|capture)\s+([^.]+?)\s*[-–—]\s*(all\s+)?(?:required|mandatory|optional)",
-                r"with\s+fields?\s+(?:for\s+)?([^.]+)"
-            ],
-            
-            # Table/UI patterns
-            "table_columns": [
-                r"(?:table|columns?)\s+(?:showing|with|for|displaying)\s+([^.]+)",
-                r"(?:show|display)\s+(?:columns?\s+for\s+)?([^.]+)\s+in\s+(?:the\s+)?table"
-            ],
-            
-            # Tab patterns
-            "tabs": [
-                r"(?:tabs?|sections?)\s*:\s*([^.]+)",
-                r"(?:split|divided)\s+into\s+(?:\d+\s+)?tabs?\s*:\s*([^.]+)"
-            ],
-            
-            # Priority indicators
-            "priority": [
-                r"(?:priority\s+is\s+|)(?:highest|high|medium|low|critical)",
-                r"(?:critical|urgent|important)\s+for"
-            ],
-            
-            # RBAC patterns
-            "rbac": [
-                r"(nurses?|doctors?|admins?|staff|users?)\s+can\s+([^.]+)",
-                r"only\s+(nurses?|doctors?|admins?)\s+(?:can|should|may)\s+([^.]+)"
-            ],
-            
-            # Validation rules
-            "validation": [
-                r"(?:should\s+not\s+allow|don't\s+allow|prevent|block)\s+([^.]+)",
-                r"(?:required\s+when|only\s+if|mandatory\s+when)\s+([^.]+)"
-            ]
-        }
+    def __init__(self):
+        self.extraction_patterns = EXTRACTION_PATTERNS
     
     def process_transcript(self, transcript_text: str, 
                           metadata: Dict = None) -> Dict:
@@ -90,11 +241,19 @@ class TranscriptProcessor:
             "clarifications_needed": []
         }
         
+        # Derived views of the transcript, computed once and shared by all epics
+        text_lower = transcript_text.lower()
+        sentences = [(sentence.strip(), sentence.lower())
+                     for sentence in SENT_SPLIT_RE.split(transcript_text)]
+        
         # Extract epics
         epics = self._extract_epics(transcript_text)
         
+        # Nothing below depends on the epic, so extract it once for all of them
+        extractions = self._extract_shared(transcript_text, text_lower)
+        
         for epic_name in epics:
-            epic_data = self._process_epic(transcript_text, epic_name)
+            epic_data = self._process_epic(sentences, epic_name, extractions)
             structure["epics"].append(epic_data)
         
         # Extract action items
@@ -115,172 +274,173 @@ class TranscriptProcessor:
         }
         
         # Try to extract date
-        date_match = re.search(r"(?:date|meeting)\s*:\s*(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4})", text, re.IGNORECASE)
+        date_match = DATE_RE.search(text)
         if date_match:
             metadata["date"] = date_match.group(1)
         
         # Try to extract attendees
-        attendees_match = re.search(r"(?:attendees|participants)\s*:\s*([^\n]+)", text, re.IGNORECASE)
+        attendees_match = ATTENDEES_RE.search(text)
         if attendees_match:
             attendees_text = attendees_match.group(1)
-            metadata["attendees"] = [a.strip() for a in re.split(r'[,;]', attendees_text) if a.strip()]
+            metadata["attendees"] = [a.strip() for a in ATTENDEE_SPLIT_RE.split(attendees_text) if a.strip()]
         
         return metadata
     
     def _extract_epics(self, text: str) -> List[str]:
         """Extract epic/feature names from transcript"""
-        epics = []
+        epics = {}  # Insertion-ordered set
         
         for pattern in self.extraction_patterns["epic_name"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 epic_name = match.group(1).strip()
-                if epic_name and epic_name not in epics:
-                    epics.append(epic_name)
+                if epic_name:
+                    epics[epic_name] = None
         
-        return epics if epics else ["Unnamed Feature"]
+        return list(epics) if epics else ["Unnamed Feature"]
     
-    def _process_epic(self, text: str, epic_name: str) -> Dict:
-        """Process requirements for a specific epic"""
+    def _extract_shared(self, text: str, text_lower: str) -> Dict:
+        """Run the transcript-wide extractions that every epic reuses"""
+        tabs = self._extract_tabs(text)
+        has_rbac = self._has_rbac_requirements(text_lower)
+        has_add = ADD_KEYWORDS_RE.search(text_lower) is not None
         
-        epic_data = {
-            "epic_name": epic_name,
-            "epic_description": self._extract_epic_description(text, epic_name),
-            "priority": self._extract_priority(text),
-            "scope": "facility-specific",  # Default, can be overridden
-            "tabs": self._extract_tabs(text),
-            "tickets": []
+        return {
+            "priority": self._extract_priority(text_lower),
+            "tabs": tabs,
+            "columns": self._extract_columns(text) if tabs else [],
+            "has_search": bool(tabs) and SEARCH_KEYWORDS_RE.search(text_lower) is not None,
+            "has_nav": NAV_KEYWORDS_RE.search(text_lower) is not None,
+            "has_rbac": has_rbac,
+            "rbac": self._extract_rbac(text) if has_rbac else {},
+            "has_add": has_add,
+            "entity_name": self._extract_entity_name(text) if has_add else None,
+            "fields": self._extract_fields(text) if has_add else []
         }
-        
-        # Generate tickets based on extracted information
-        tickets = self._generate_tickets_from_text(text, epic_name, epic_data)
-        epic_data["tickets"] = tickets
-        
-        return epic_data
     
-    def _extract_epic_description(self, text: str, epic_name: str) -> str:
-        """Extract description for an epic"""
-        # Look for sentences mentioning the epic name
-        sentences = re.split(r'[.!?]', text)
-        
-        for sentence in sentences:
-            if epic_name.lower() in sentence.lower():
-                # Clean and return
-                description = sentence.strip()
-                if len(description) > 20:
-                    return description
+    def _process_epic(self, sentences: List[Tuple[str, str]], epic_name: str,
+                      extractions: Dict) -> EpicData:
+        """Process requirements for a specific epic"""
         
-        return f"Feature for {epic_name}"
+        return EpicData(
+            epic_name=epic_name,
+            epic_description=self._extract_epic_description(sentences, epic_name),
+            priority=extractions["priority"],
+            tabs=list(extractions["tabs"]),
+            # Generate tickets based on extracted information
+            tickets=self._generate_tickets_from_text(epic_name, extractions)
+        )
     
-    def _extract_priority(self, text: str) -> str:
-        """Extract priority from transcript"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["highest", "critical", "urgent"]):
-            return "Highest"
-        elif "high priority" in text_lower or "important" in text_lower:
-            return "High"
-        elif "low priority" in text_lower:
-            return "Low"
-        else:
-            return "Medium"
+    def _extract_epic_description(self, sentences: List[Tuple[str, str]], epic_name: str) -> str:
+        """Extract description for an epic from (stripped, lowercased) sentence pairs"""
+        epic_name_lower = epic_name.lower()
+        
+        # First sufficiently long sentence mentioning the epic name
+        return next(
+            (sentence for sentence, sentence_lower in sentences
+             if epic_name_lower in sentence_lower and len(sentence) > 20),
+            f"Feature for {epic_name}"
+        )
+    
+    def _extract_priority(self, text_lower: str) -> str:
+        """Extract priority from the lowercased transcript (strongest cue wins)"""
+        level = None
+        for match in PRIORITY_RE.finditer(text_lower):
+            if match.lastindex == 1:
+                return "Highest"
+            level = min(level or match.lastindex, match.lastindex)
+        
+        return PRIORITY_LEVELS[level] if level else "Medium"
     
     def _extract_tabs(self, text: str) -> List[str]:
         """Extract tab names from transcript"""
-        tabs = []
+        tabs = {}  # Insertion-ordered set
         
         for pattern in self.extraction_patterns["tabs"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 tabs_text = match.group(1)
                 # Split on commas, 'and', etc.
-                tab_names = re.split(r'[,;]|\s+and\s+', tabs_text)
-                tabs.extend([t.strip() for t in tab_names if t.strip()])
+                tab_names = split_list(tabs_text)
+                tabs.update((t.strip(), None) for t in tab_names if t.strip())
         
-        return tabs
+        return list(tabs)
     
-    def _generate_tickets_from_text(self, text: str, epic_name: str, 
-                                    epic_data: Dict) -> List[Dict]:
-        """Generate ticket structures from text analysis"""
+    def _generate_tickets_from_text(self, epic_name: str, extractions: Dict) -> List[TicketSpec]:
+        """Generate ticket structures from the shared transcript extractions (copied per ticket)"""
         tickets = []
         
         # Always add backend architecture
-        tickets.append({
-            "ticket_type": "backend_architecture",
-            "summary": f"BE: Implement backend architecture of \"{epic_name}\"",
-            "priority": "High"
-        })
+        tickets.append(TicketSpec(
+            "backend_architecture",
+            f"BE: Implement backend architecture of \"{epic_name}\""
+        ))
         
         # Check for RBAC mentions
-        if self._has_rbac_requirements(text):
-            tickets.append({
-                "ticket_type": "rbac_permissions",
-                "summary": f"Adding RBAC permissions related to \"{epic_name}\"",
-                "priority": "High",
-                "details": {
-                    "rbac": self._extract_rbac(text)
+        if extractions["has_rbac"]:
+            tickets.append(TicketSpec(
+                "rbac_permissions",
+                f"Adding RBAC permissions related to \"{epic_name}\"",
+                details={
+                    "rbac": copy.deepcopy(extractions["rbac"])
                 }
-            })
+            ))
         
         # Check for navigation menu
-        if any(word in text.lower() for word in ["menu", "navigation", "nav bar", "sidebar"]):
-            tickets.append({
-                "ticket_type": "nav_menu",
-                "summary": f"FE: User should be able to view a new menu \"{epic_name}\" under \"Clinical\" in nav panel",
-                "priority": "High"
-            })
+        if extractions["has_nav"]:
+            tickets.append(TicketSpec(
+                "nav_menu",
+                f"FE: User should be able to view a new menu \"{epic_name}\" under \"Clinical\" in nav panel"
+            ))
         
         # Generate tab-specific tickets
-        for tab in epic_data.get("tabs", []):
+        columns = extractions["columns"]
+        has_search = extractions["has_search"]
+        
+        for tab in extractions["tabs"]:
             # View table ticket
-            tickets.append({
-                "ticket_type": "view_table_data",
-                "summary": f"User should be able to access and view data in the table of '{tab}' tab",
-                "priority": "High",
-                "details": {
+            tickets.append(TicketSpec(
+                "view_table_data",
+                f"User should be able to access and view data in the table of '{tab}' tab",
+                details={
                     "tab_name": tab,
-                    "columns": self._extract_columns(text, tab)
+                    "columns": list(columns)
                 }
-            })
+            ))
             
             # Search/filter ticket
-            if any(word in text.lower() for word in ["search", "filter", "find"]):
-                tickets.append({
-                    "ticket_type": "search_filter",
-                    "summary": f"User should be able to search and filter data in '{tab}' tab",
-                    "priority": "High",
-                    "details": {
+            if has_search:
+                tickets.append(TicketSpec(
+                    "search_filter",
+                    f"User should be able to search and filter data in '{tab}' tab",
+                    details={
                         "tab_name": tab
                     }
-                })
+                ))
         
         # Check for add/create functionality
-        if any(word in text.lower() for word in ["add", "create", "new", "form"]):
-            entity_name = self._extract_entity_name(text, epic_name)
-            tickets.append({
-                "ticket_type": "add_entity",
-                "summary": f"User should be able to add a {entity_name}",
-                "priority": "High",
-                "details": {
+        if extractions["has_add"]:
+            # Default to epic name when the transcript doesn't say what is added
+            entity_name = extractions["entity_name"] or epic_name.lower().replace(" ", "_")
+            tickets.append(TicketSpec(
+                "add_entity",
+                f"User should be able to add a {entity_name}",
+                details={
                     "entity_name": entity_name,
-                    "fields": self._extract_fields(text)
+                    "fields": copy.deepcopy(extractions["fields"])
                 }
-            })
+            ))
         
         return tickets
     
-    def _has_rbac_requirements(self, text: str) -> bool:
-        """Check if transcript mentions RBAC"""
-        rbac_keywords = ["permission", "access", "role", "only", "can view", "can edit", "restricted"]
-        return any(keyword in text.lower() for keyword in rbac_keywords)
+    def _has_rbac_requirements(self, text_lower: str) -> bool:
+        """Check if the lowercased transcript mentions RBAC"""
+        return RBAC_KEYWORDS_RE.search(text_lower) is not None
     
     def _extract_rbac(self, text: str) -> Dict:
         """Extract RBAC requirements"""
         rbac = {}
         
         for pattern in self.extraction_patterns["rbac"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 role = match.group(1).capitalize()
                 action = match.group(2) if len(match.groups()) > 1 else match.group(1)
                 
@@ -291,58 +451,50 @@ class TranscriptProcessor:
         
         return rbac
     
-    def _extract_columns(self, text: str, tab_name: str = None) -> List[str]:
+    def _extract_columns(self, text: str) -> List[str]:
         """Extract table column names"""
-        columns = []
+        columns = {}  # Insertion-ordered set
         
         for pattern in self.extraction_patterns["table_columns"]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 columns_text = match.group(1)
                 # Split on commas, 'and', etc.
-                column_names = re.split(r'[,;]|\s+and\s+', columns_text)
-                columns.extend([c.strip() for c in column_names if c.strip()])
+                column_names = split_list(columns_text)
+                columns.update((c.strip(), None) for c in column_names if c.strip())
         
-        return columns if columns else ["<Column 1>", "<Column 2>", "<Column 3>"]
+        return list(columns) if columns else ["<Column 1>", "<Column 2>", "<Column 3>"]
     
-    def _extract_entity_name(self, text: str, epic_name: str) -> str:
-        """Extract entity name for add/create operations"""
+    def _extract_entity_name(self, text: str) -> Optional[str]:
+        """Extract entity name for add/create operations (None if not mentioned)"""
         # Try to find what's being added
-        add_match = re.search(r"add\s+(?:a\s+|an\s+)?(\w+)", text, re.IGNORECASE)
+        add_match = ENTITY_RE.search(text)
         if add_match:
             return add_match.group(1).lower()
         
-        # Default to epic name
-        return epic_name.lower().replace(" ", "_")
+        return None
     
-    def _extract_fields(self, text: str) -> List[Dict]:
+    def _extract_fields(self, text: str) -> List[Field]:
         """Extract field specifications"""
         fields = []
         
         # Look for field mentions
-        field_patterns = [
-            r"fields?\s+(?:for|include)\s+([^.]+)",
-            r"(?:need|require|capture)\s+([^.]+?)\s*[-–—]\s*(?:all\s+)?(?:required|mandatory|optional)"
-        ]
-        
-        for pattern in field_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.extraction_patterns["field_spec"]:
+            for match in pattern.finditer(text):
                 fields_text = match.group(1)
                 # Split on commas, 'and', etc.
-                field_names = re.split(r'[,;]|\s+and\s+', fields_text)
+                field_names = split_list(fields_text)
                 
                 for field_name in field_names:
                     field_name = field_name.strip()
                     if field_name and len(field_name) > 2:
-                        fields.append({
-                            "name": field_name.capitalize(),
-                            "type": self._guess_field_type(field_name),
-                            "mandatory": self._is_mandatory(text, field_name)
-                        })
+                        fields.append(Field(
+                            name=field_name.capitalize(),
+                            type=self._guess_field_type(field_name),
+                            mandatory=self._is_mandatory(text, field_name)
+                        ))
         
         return fields if fields else [
-            {"name": "<Field 1>", "type": "Text field", "mandatory": True}
+            Field(name="<Field 1>", type="Text field", mandatory=True)
         ]
     
     def _guess_field_type(self, field_name: str) -> str:
@@ -367,11 +519,10 @@ class TranscriptProcessor:
     def _is_mandatory(self, text: str, field_name: str) -> bool:
         """Determine if a field is mandatory"""
         # Look for context around the field name
-        context_pattern = f"{field_name}[^.]*?(required|mandatory|optional)"
-        match = re.search(context_pattern, text, re.IGNORECASE)
+        match = mandatory_regex(field_name).search(text)
         
         if match:
-            return match.group(1).lower() in ["required", "mandatory"]
+            return match.group(1).lower() in MANDATORY_WORDS
         
         # Default to mandatory
         return True
@@ -381,13 +532,8 @@ class TranscriptProcessor:
         action_items = []
         
         # Look for action item patterns
-        patterns = [
-            r"(?:action item|todo|task)\s*:\s*([^.]+)",
-            r"([A-Z][^.]+?)\s+(?:will|should|needs? to)\s+([^.]+)\s+by\s+(\d{1,2}/\d{1,2}|\w+ \d{1,2})"
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in ACTION_ITEM_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 action_items.append({
                     "item": match.group(0).strip(),
@@ -401,71 +547,132 @@ class TranscriptProcessor:
         """Identify areas needing clarification"""
         clarifications = []
         
-        for epic in structure.get("epics", []):
+        for epic in map(as_epic, structure.get("epics", [])):
             # Check for incomplete field specs
-            for ticket in epic.get("tickets", []):
-                if ticket.get("ticket_type") == "add_entity":
-                    fields = ticket.get("details", {}).get("fields", [])
-                    if any("<" in f.get("name", "") for f in fields):
+            for ticket in epic.tickets:
+                if ticket.ticket_type == "add_entity":
+                    fields = ticket.details.get("fields", [])
+                    if any("<" in f.name for f in fields):
                         clarifications.append({
-                            "question": f"Field specifications incomplete for {ticket['summary']}",
+                            "question": f"Field specifications incomplete for {ticket.summary}",
                             "context": "Field names or types contain placeholders"
                         })
                 
                 # Check for missing column specs
-                if ticket.get("ticket_type") == "view_table_data":
-                    columns = ticket.get("details", {}).get("columns", [])
+                if ticket.ticket_type == "view_table_data":
+                    columns = ticket.details.get("columns", [])
                     if any("<" in col for col in columns):
                         clarifications.append({
-                            "question": f"Column specifications incomplete for {ticket['summary']}",
+                            "question": f"Column specifications incomplete for {ticket.summary}",
                             "context": "Column names contain placeholders"
                         })
         
         return clarifications
     
-    def save_structured_output(self, structure: Dict, output_path: str):
-        """Save structured output to JSON file"""
-        with open(output_path, 'w') as f:
-            json.dump(structure, f, indent=2)
+    def save_structured_output(self, structure: Dict, output_path: str, compact: bool = False):
+        """Save structured output to JSON file (compact for machine consumers)"""
+        write_json(output_path, structure, compact)
     
     def generate_review_report(self, structure: Dict) -> str:
         """Generate a human-readable review report"""
-        report = []
-        report.append("=" * 70)
-        report.append("EXTRACTED REQUIREMENTS - REVIEW REPORT")
-        report.append("=" * 70)
+        separator = "=" * 70
+        out = io.StringIO()
+        out.write(f"{separator}\nEXTRACTED REQUIREMENTS - REVIEW REPORT\n{separator}\n")
         
         # Metadata
         metadata = structure.get("meeting_metadata", {})
-        report.append(f"\nMeeting Date: {metadata.get('date', 'Unknown')}")
-        report.append(f"Attendees: {', '.join(metadata.get('attendees', ['Unknown']))}")
+        out.write(f"\nMeeting Date: {metadata.get('date', 'Unknown')}\n")
+        out.write(f"Attendees: {', '.join(metadata.get('attendees', ['Unknown']))}\n")
 
         # Epics
-        report.append(f"\nEpics Found: {len(structure.get('epics', []))}")
+        epics = [as_epic(epic) for epic in structure.get("epics", [])]
+        out.write(f"\nEpics Found: {len(epics)}\n")
         
-        for i, epic in enumerate(structure.get("epics", []), 1):
-            report.append(f"\n{i}. {epic['epic_name']}")
-            report.append(f"   Priority: {epic['priority']}")
-            report.append(f"   Tickets: {len(epic.get('tickets', []))}")
-            report.append(f"   Tabs: {', '.join(epic.get('tabs', ['None']))}")
+        for i, epic in enumerate(epics, 1):
+            out.write(
+                f"\n{i}. {epic.epic_name}\n"
+                f"   Priority: {epic.priority}\n"
+                f"   Tickets: {len(epic.tickets)}\n"
+                f"   Tabs: {', '.join(epic.tabs)}\n"
+            )
         
         # Action Items
         action_items = structure.get("action_items", [])
         if action_items:
-            report.append(f"\nAction Items: {len(action_items)}")
+            out.write(f"\nAction Items: {len(action_items)}\n")
             for item in action_items[:3]:  # Show first 3
-                report.append(f"   - {item['item']}")
+                out.write(f"   - {item['item']}\n")
 
         # Clarifications
         clarifications = structure.get("clarifications_needed", [])
         if clarifications:
-            report.append(f"\nClarifications Needed: {len(clarifications)}")
+            out.write(f"\nClarifications Needed: {len(clarifications)}\n")
             for clarif in clarifications:
-                report.append(f"   - {clarif['question']}")
+                out.write(f"   - {clarif['question']}\n")
         
-        report.append("\n" + "=" * 70)
+        out.write(f"\n{separator}")
         
-        return "\n".join(report)
+        return out.getvalue()
+
+
+def process_file(transcript_file: str, output_path: str = None, review: bool = False,
+                 compact: bool = False) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Process one transcript file and write its outputs
+    
+    Returns:
+        (structured output path, review report or None, report path or None)
+    """
+    # Outputs sit beside the transcript (or --output), as <stem>_structured.json and <stem>_review.txt
+    stem = str(Path(transcript_file).with_suffix(''))
+    if output_path:
+        report_path = str(Path(output_path).with_suffix('')) + '_review.txt'
+    else:
+        output_path = stem + '_structured.json'
+        report_path = stem + '_review.txt'
+    
+    transcript = Path(transcript_file).resolve()
+    for path in (output_path, report_path if review else None):
+        if path and Path(path).resolve() == transcript:
+            raise ValueError(f"Output path {path} would overwrite the transcript")
+    
+    processor = TranscriptProcessor()
+    structure = processor.process_transcript(read_transcript(transcript_file))
+    processor.save_structured_output(structure, output_path, compact)
+    
+    if not review:
+        return output_path, None, None
+    
+    report = processor.generate_review_report(structure)
+    with open(report_path, 'w') as f:
+        f.write(report)
+    return output_path, report, report_path
+
+
+def select_transcripts(paths: List[str]) -> Tuple[List[str], List[str]]:
+    """Split glob matches into transcripts and review reports generated for them (sorted)"""
+    candidates = {path for path in paths if path.endswith(TRANSCRIPT_SUFFIX)}
+    # Only <stem>_review.txt beside a matched <stem>.txt is ours; e.g. design_review.txt alone is a transcript
+    reports = {path for path in candidates
+               if path.endswith('_review.txt') and path[:-len('_review.txt')] + TRANSCRIPT_SUFFIX in candidates}
+    return sorted(candidates - reports), sorted(reports)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"{value} is not a positive integer")
+    return number
+
+
+def print_result(output_path: str, report: Optional[str], report_path: Optional[str]):
+    """Print where a transcript's outputs were saved, and its review report"""
+    print(f"[SUCCESS] Structured output saved to: {output_path}")
+    
+    if report is not None:
+        print("\n" + report)
+        print(f"\n[SUCCESS] Review report saved to: {report_path}")
 
 
 def main():
@@ -473,37 +680,43 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Process meeting transcripts")
-    parser.add_argument('transcript_file', help="Path to transcript file")
+    parser.add_argument('transcript_file', nargs='?', help="Path to transcript file")
+    parser.add_argument('--inputs', metavar='GLOB',
+                       help="Process every .txt transcript matching GLOB in parallel (e.g. 'transcripts/*')")
+    parser.add_argument('--workers', type=positive_int,
+                       help="Worker processes for --inputs (default: one per CPU)")
     parser.add_argument('--output', '-o', help="Output JSON file path")
     parser.add_argument('--review', '-r', action='store_true', 
                        help="Generate review report")
+    parser.add_argument('--compact', action='store_true',
+                       help="Write compact JSON (no indentation) for machine consumers")
     
     args = parser.parse_args()
     
-    # Read transcript
-    with open(args.transcript_file, 'r') as f:
-        transcript_text = f.read()
+    if not args.inputs:
+        if not args.transcript_file:
+            parser.error("a transcript file or --inputs is required")
+        try:
+            result = process_file(args.transcript_file, args.output, args.review, args.compact)
+        except ValueError as e:
+            parser.error(str(e))
+        print_result(*result)
+        return
     
-    # Process
-    processor = TranscriptProcessor()
-    structure = processor.process_transcript(transcript_text)
+    if args.transcript_file or args.output:
+        parser.error("--inputs cannot be combined with a transcript file or --output")
     
-    # Output
-    output_path = args.output or args.transcript_file.replace('.txt', '_structured.json')
-    processor.save_structured_output(structure, output_path)
-
-    print(f"[SUCCESS] Structured output saved to: {output_path}")
+    # Only transcripts - never docs, or the review reports left beside them by earlier runs
+    paths, reports = select_transcripts(glob.glob(args.inputs, recursive=True))
+    if reports:
+        print(f"[SKIPPED] Review reports from earlier runs: {', '.join(reports)}")
+    if not paths:
+        parser.error(f"no transcripts match {args.inputs}")
     
-    # Review report
-    if args.review:
-        report = processor.generate_review_report(structure)
-        print("\n" + report)
-
-        # Save report
-        report_path = output_path.replace('.json', '_review.txt')
-        with open(report_path, 'w') as f:
-            f.write(report)
-        print(f"\n[SUCCESS] Review report saved to: {report_path}")
+    process = functools.partial(process_file, review=args.review, compact=args.compact)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for result in executor.map(process, paths):
+            print_result(*result)
 
 
 if __name__ == "__main__":
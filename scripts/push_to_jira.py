@@ -4,14 +4,32 @@ JIRA Ticket Creator - Atlassian API Integration
 Creates tickets in JIRA using the Atlassian connector
 """
 
-import json
+import asyncio
 import sys
 from pathlib import Path
 
+# Make the project root importable when run as a script
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.json_io import read_json
+
+# Upper bound on in-flight create calls, to stay within Atlassian rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Most issues the bulk-create endpoint accepts per call
+BULK_CHUNK_SIZE = 50
+
+# Answers that confirm ticket creation
+CONFIRM_RESPONSES = frozenset({"yes", "y"})
+
 
 class JiraTicketCreator:
     """Create tickets in JIRA via Atlassian API"""
     
+    __slots__ = ("cloud_id", "project_key")
+    
     def __init__(self, cloud_id: str = "b62faa91-9d69-4d74-b5d3-a6ca7ee49309"):
         self.cloud_id = cloud_id
         self.project_key = "VDB"
@@ -62,6 +80,52 @@ class JiraTicketCreator:
             "data": issue_data
         }
     
+    def _issue_fields(self, ticket: dict, epic_key: str = None) -> dict:
+        """Build the bulk-create "fields" payload for one ticket"""
+        fields = {
+            "project": {"key": self.project_key},
+            "issuetype": {"name": ticket.get('type', 'Story')},
+            "summary": ticket['summary'],
+            "description": ticket['description'],
+            "priority": {"name": ticket.get('priority', 'Medium')}
+        }
+        
+        if epic_key:
+            fields["parent"] = {"key": epic_key}
+        
+        return fields
+    
+    def create_issues_bulk(self, issue_fields: list) -> dict:
+        """
+        Create up to BULK_CHUNK_SIZE JIRA issues in one request
+        
+        This is a placeholder for the actual API call.
+        In production this is a single POST /rest/api/3/issue/bulk with
+        {"issueUpdates": [{"fields": {...}}, ...]}
+        
+        Args:
+            issue_fields: "fields" payloads built by _issue_fields
+        
+        Returns:
+            dict: "issues" created in request order, and "errors" whose
+            failedElementNumber indexes into the request
+        """
+        
+        payload = {
+            "issueUpdates": [{"fields": fields} for fields in issue_fields]
+        }
+        
+        # This would be the actual API call in production
+        # result = POST /rest/api/3/issue/bulk (cloudId: self.cloud_id) with payload
+        
+        return {
+            "issues": [
+                {"message": "Would create ticket (API call placeholder)", "data": update}
+                for update in payload["issueUpdates"]
+            ],
+            "errors": []
+        }
+    
     def create_epic(self, summary: str, description: str = None) -> dict:
         """
         Create an Epic in JIRA
@@ -87,64 +151,128 @@ class JiraTicketCreator:
             "data": epic_data
         }
     
-    def create_batch(self, tickets: list, epic_key: str = None) -> dict:
+    async def _create_chunk_async(self, semaphore: asyncio.Semaphore, issue_fields: list) -> dict:
+        """Bulk-create one chunk off the event loop, holding a semaphore slot"""
+        async with semaphore:
+            return await asyncio.to_thread(self.create_issues_bulk, issue_fields)
+    
+    async def create_batch_async(self, tickets: list, epic_key: str = None,
+                                 concurrency: int = MAX_CONCURRENT_REQUESTS) -> dict:
         """
-        Create multiple tickets in batch
+        Create multiple tickets with concurrent bulk-create calls
         
         Args:
             tickets: List of ticket dictionaries
             epic_key: Optional epic to link tickets to
+            concurrency: Maximum number of bulk calls in flight
             
         Returns:
-            dict: Results summary
+            dict: Results summary, in ticket order
         """
         
+        # Validate each ticket up front so a bad one fails alone, not its whole chunk
+        errors = {}
+        pending = []
+        for index, ticket in enumerate(tickets):
+            try:
+                pending.append((index, self._issue_fields(ticket, epic_key)))
+            except KeyError as e:
+                errors[index] = f"Missing required field {e}"
+        
+        chunks = [pending[i:i + BULK_CHUNK_SIZE] for i in range(0, len(pending), BULK_CHUNK_SIZE)]
+        semaphore = asyncio.Semaphore(concurrency)
+        responses = await asyncio.gather(
+            *(self._create_chunk_async(semaphore, [fields for _, fields in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        created = {}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException) and not isinstance(response, Exception):
+                raise response
+            
+            if isinstance(response, Exception):
+                # The whole request failed, so every ticket in it did
+                for index, _ in chunk:
+                    errors[index] = str(response)
+                continue
+            
+            chunk_errors = {error["failedElementNumber"]: str(error.get("elementErrors", error))
+                            for error in response.get("errors", [])}
+            issues = iter(response.get("issues", []))
+            for j, (index, _) in enumerate(chunk):
+                if j in chunk_errors:
+                    errors[index] = chunk_errors[j]
+                    continue
+                
+                result = next(issues, None)
+                if result is None:
+                    errors[index] = "No issue returned for ticket"
+                else:
+                    created[index] = result
+        
+        total = len(tickets)
         results = {
             "created": [],
             "failed": [],
-            "total": len(tickets)
+            "total": total
         }
+        lines = []
         
-        for i, ticket in enumerate(tickets, 1):
-            print(f"\nCreating ticket {i}/{len(tickets)}: {ticket['summary'][:60]}...")
+        for index, ticket in enumerate(tickets):
+            summary = ticket.get('summary', '')
+            lines.append(f"\nCreating ticket {index + 1}/{total}: {summary[:60]}...")
             
-            try:
-                result = self.create_issue(
-                    summary=ticket['summary'],
-                    description=ticket['description'],
-                    issue_type=ticket.get('type', 'Story'),
-                    priority=ticket.get('priority', 'Medium'),
-                    epic_key=epic_key
-                )
+            if index in created:
                 results["created"].append({
-                    "summary": ticket['summary'],
-                    "result": result
+                    "summary": summary,
+                    "result": created[index]
                 })
-                print(f"  ✅ Created (placeholder)")
-            except Exception as e:
+                lines.append(f"  ✅ Created (placeholder)")
+            else:
                 results["failed"].append({
-                    "summary": ticket['summary'],
-                    "error": str(e)
+                    "summary": summary,
+                    "error": errors[index]
                 })
-                print(f"  ❌ Failed: {e}")
+                lines.append(f"  ❌ Failed: {errors[index]}")
         
+        print("\n".join(lines))
         return results
     
+    def create_batch(self, tickets: list, epic_key: str = None) -> dict:
+        """
+        Create multiple tickets in batch
+        
+        Args:
+            tickets: List of ticket dictionaries
+            epic_key: Optional epic to link tickets to
+            
+        Returns:
+            dict: Results summary
+        """
+        return asyncio.run(self.create_batch_async(tickets, epic_key=epic_key))
+    
     def preview_tickets(self, tickets: list):
         """Preview tickets before creation"""
-        print("\n" + "=" * 70)
-        print(f"TICKET PREVIEW ({len(tickets)} tickets)")
-        print("=" * 70)
+        separator = "=" * 70
+        lines = [f"\n{separator}", f"TICKET PREVIEW ({len(tickets)} tickets)", separator]
         
         for i, ticket in enumerate(tickets, 1):
-            print(f"\n{i}. [{ticket.get('priority', 'Medium')}] {ticket.get('type', 'Story')}")
-            print(f"   {ticket['summary']}")
-            print(f"   Description length: {len(ticket.get('description', ''))} chars")
+            priority = ticket.get('priority', 'Medium')
+            ticket_type = ticket.get('type', 'Story')
+            summary = ticket['summary']
+            description = ticket.get('description', '')
+            lines.append(
+                f"\n{i}. [{priority}] {ticket_type}\n"
+                f"   {summary}\n"
+                f"   Description length: {len(description)} chars"
+            )
+        
+        print("\n".join(lines))
     
     def load_batch_file(self, filepath: str) -> dict:
         """Load tickets from JSON file"""
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return read_json(filepath)
     
     def create_from_file(self, filepath: str, epic_key: str = None, 
                         dry_run: bool = False):
@@ -165,7 +293,7 @@ class JiraTicketCreator:
         
         # Confirm
         response = input(f"\n❓ Create {len(tickets)} tickets in JIRA? (yes/no): ").strip().lower()
-        if response not in ['yes', 'y']:
+        if response not in CONFIRM_RESPONSES:
             print("❌ Cancelled")
             return
         
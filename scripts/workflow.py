@@ -5,21 +5,54 @@ Complete pipeline from transcript to JIRA tickets
 """
 
 import sys
-import json
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
-sys.path.insert(0, str(Path(__file__).parent))
+if TYPE_CHECKING:
+    from process_transcript import TicketSpec
 
-from ticket_generator import TicketGenerator
-from process_transcript import TranscriptProcessor
+
+SEPARATOR = "=" * 70
+
+
+def banner(title: str) -> str:
+    """Format a step header between separator lines"""
+    return f"\n{SEPARATOR}\n{title}\n{SEPARATOR}"
+
+
+class WorkflowPaths(NamedTuple):
+    """A transcript and the output files derived from it"""
+    transcript: str
+    structured: str
+    review: str
+    batch: str
+    
+    @classmethod
+    def from_transcript(cls, transcript_path: str) -> "WorkflowPaths":
+        """Derive <stem>_structured.json, <stem>_review.txt and <stem>_tickets.json beside the transcript"""
+        stem = str(Path(transcript_path).with_suffix(''))
+        return cls(transcript_path, stem + '_structured.json', stem + '_review.txt', stem + '_tickets.json')
+
+
+def _ensure_paths():
+    """Make the project root and sibling scripts importable when run as a script"""
+    for path in (str(Path(__file__).resolve().parent.parent), str(Path(__file__).resolve().parent)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
 
 
 class WorkflowOrchestrator:
     """Orchestrate the complete transcript-to-JIRA workflow"""
     
     def __init__(self):
+        # Imported here so `--help` and argument errors skip the pipeline's import cost
+        _ensure_paths()
+        from utils.json_io import write_json
+        from utils.ticket_generator import TicketGenerator
+        from process_transcript import TranscriptProcessor, read_transcript
+        
+        self.read_transcript = read_transcript
+        self.write_json = write_json
         self.transcript_processor = TranscriptProcessor()
         self.ticket_generator = TicketGenerator()
         self.workflow_state = {}
@@ -49,43 +82,41 @@ class WorkflowOrchestrator:
             "tickets_created": 0
         }
         
-        print("\n" + "=" * 70)
-        print("JIRA AUTOMATION WORKFLOW - COMPLETE PIPELINE")
-        print("=" * 70)
+        # Step headers are printed as each step starts; the lines a step
+        # produces are collected and printed in one call when it finishes
+        print(
+            f"{banner('JIRA AUTOMATION WORKFLOW - COMPLETE PIPELINE')}\n"
+            f"\n📝 STEP 1: Processing Transcript...\n"
+            f"   Input: {transcript_path}"
+        )
         
         # STEP 1: Process Transcript
-        print("\n📝 STEP 1: Processing Transcript...")
-        print(f"   Input: {transcript_path}")
-        
-        with open(transcript_path, 'r') as f:
-            transcript_text = f.read()
+        paths = WorkflowPaths.from_transcript(transcript_path)
+        # Same reader as process_transcript.py, so both normalize line endings alike
+        transcript_text = self.read_transcript(paths.transcript)
         
         structured_data = self.transcript_processor.process_transcript(transcript_text)
         
         # Save structured output
-        structured_path = transcript_path.replace('.txt', '_structured.json')
-        self.transcript_processor.save_structured_output(structured_data, structured_path)
-        results["files_generated"].append(structured_path)
+        self.transcript_processor.save_structured_output(structured_data, paths.structured)
+        results["files_generated"].append(paths.structured)
         results["steps_completed"].append("transcript_processing")
         
-        print(f"   ✅ Structured data saved: {structured_path}")
-        print(f"   📊 Found {len(structured_data['epics'])} epic(s)")
-        
         # Generate review report
         review_report = self.transcript_processor.generate_review_report(structured_data)
-        review_path = transcript_path.replace('.txt', '_review.txt')
-        with open(review_path, 'w') as f:
+        with open(paths.review, 'w') as f:
             f.write(review_report)
-        results["files_generated"].append(review_path)
+        results["files_generated"].append(paths.review)
         
-        print(f"   📄 Review report: {review_path}")
+        print(
+            f"   ✅ Structured data saved: {paths.structured}\n"
+            f"   📊 Found {len(structured_data['epics'])} epic(s)\n"
+            f"   📄 Review report: {paths.review}"
+        )
         
         # STEP 2: User Review (if interactive)
         if interactive:
-            print("\n" + "=" * 70)
-            print("📋 STEP 2: User Review")
-            print("=" * 70)
-            print(review_report)
+            print(f"{banner('📋 STEP 2: User Review')}\n{review_report}")
             
             response = input("\n❓ Proceed with ticket generation? (yes/no/edit): ").strip().lower()
             
@@ -93,41 +124,40 @@ class WorkflowOrchestrator:
                 print("\n❌ Workflow cancelled by user")
                 return results
             elif response == 'edit':
-                print(f"\n✏️  Please edit: {structured_path}")
-                print("   Then run workflow again with edited file.")
+                print(f"\n✏️  Please edit: {paths.structured}\n"
+                      "   Then run workflow again with edited file.")
                 return results
         else:
             results["steps_completed"].append("automated_review")
         
         # STEP 3: Generate Tickets
-        print("\n" + "=" * 70)
-        print("🎫 STEP 3: Generating JIRA Tickets")
-        print("=" * 70)
+        print(banner("🎫 STEP 3: Generating JIRA Tickets"))
         
         all_tickets = []
+        lines = []
         
         for epic in structured_data['epics']:
-            print(f"\n   Processing epic: {epic['epic_name']}")
+            epic_name = epic.epic_name
+            lines.append(f"\n   Processing epic: {epic_name}")
             
-            for ticket_spec in epic['tickets']:
-                ticket = self._generate_ticket_from_spec(ticket_spec, epic)
+            for ticket_spec in epic.tickets:
+                ticket = self._generate_ticket_from_spec(ticket_spec, epic_name)
                 all_tickets.append(ticket)
-                print(f"      ✓ {ticket_spec['ticket_type']}: {ticket['summary'][:60]}...")
+                lines.append(f"      ✓ {ticket_spec.ticket_type}: {ticket['summary'][:60]}...")
         
+        print("\n".join(lines))
         results["tickets_created"] = len(all_tickets)
         results["steps_completed"].append("ticket_generation")
         
         # STEP 4: Save Ticket Batch
-        print("\n" + "=" * 70)
-        print("💾 STEP 4: Saving Ticket Batch")
-        print("=" * 70)
+        print(banner("💾 STEP 4: Saving Ticket Batch"))
         
         batch_data = {
             "project": "VDB",
-            "source_transcript": transcript_path,
-            "structured_data": structured_path,
+            "source_transcript": paths.transcript,
+            "structured_data": paths.structured,
             "total_tickets": len(all_tickets),
-            "epics": [epic['epic_name'] for epic in structured_data['epics']],
+            "epics": [epic.epic_name for epic in structured_data['epics']],
             "tickets": all_tickets,
             "metadata": {
                 "generated_date": structured_data['meeting_metadata']['date'],
@@ -136,60 +166,59 @@ class WorkflowOrchestrator:
             }
         }
         
-        batch_path = transcript_path.replace('.txt', '_tickets.json')
-        with open(batch_path, 'w') as f:
-            json.dump(batch_data, f, indent=2)
+        self.write_json(paths.batch, batch_data)
         
-        results["files_generated"].append(batch_path)
+        results["files_generated"].append(paths.batch)
         results["steps_completed"].append("batch_creation")
         
-        print(f"   ✅ Ticket batch saved: {batch_path}")
-        print(f"   📊 Total tickets: {len(all_tickets)}")
+        print(
+            f"   ✅ Ticket batch saved: {paths.batch}\n"
+            f"   📊 Total tickets: {len(all_tickets)}"
+        )
         
         # STEP 5: Summary
-        print("\n" + "=" * 70)
-        print("✨ WORKFLOW COMPLETE")
-        print("=" * 70)
-        
-        print(f"\n📁 Files Generated:")
-        for file_path in results["files_generated"]:
-            print(f"   - {file_path}")
+        lines = [banner("✨ WORKFLOW COMPLETE"), "\n📁 Files Generated:"]
+        lines.extend(f"   - {file_path}" for file_path in results["files_generated"])
         
-        print(f"\n🎫 Tickets Ready: {results['tickets_created']}")
+        lines.append(f"\n🎫 Tickets Ready: {results['tickets_created']}")
         
-        print(f"\n🚀 Next Steps:")
-        print(f"   1. Review tickets: cat {batch_path}")
-        print(f"   2. Dry run: python3 scripts/push_to_jira.py {batch_path} --dry-run")
-        print(f"   3. Push to JIRA: python3 scripts/push_to_jira.py {batch_path} --epic-key VDB-XXXX")
+        lines.append(
+            f"\n🚀 Next Steps:\n"
+            f"   1. Review tickets: cat {paths.batch}\n"
+            f"   2. Dry run: python3 scripts/push_to_jira.py {paths.batch} --dry-run\n"
+            f"   3. Push to JIRA: python3 scripts/push_to_jira.py {paths.batch} --epic-key VDB-XXXX"
+        )
         
-        if structured_data.get('clarifications_needed'):
-            print(f"\n⚠️  {len(structured_data['clarifications_needed'])} clarification(s) needed:")
-            for clarif in structured_data['clarifications_needed'][:3]:
-                print(f"   - {clarif['question']}")
+        clarifications = structured_data.get('clarifications_needed')
+        if clarifications:
+            lines.append(f"\n⚠️  {len(clarifications)} clarification(s) needed:")
+            lines.extend(f"   - {clarif['question']}" for clarif in clarifications[:3])
         
-        print("\n" + "=" * 70)
+        lines.append("\n" + SEPARATOR)
+        print("\n".join(lines))
         
         return results
     
-    def _generate_ticket_from_spec(self, ticket_spec: dict, epic: dict) -> dict:
+    def _generate_ticket_from_spec(self, ticket_spec: "TicketSpec", feature_name: str) -> dict:
         """Generate a complete ticket from specification"""
         
-        ticket_type = ticket_spec['ticket_type']
-        details = ticket_spec.get('details', {})
+        ticket_type = ticket_spec.ticket_type
+        details = ticket_spec.details
+        if "fields" in details:
+            # The ticket generator takes field specs as plain dicts
+            details = {**details, "fields": [f.to_dict() for f in details["fields"]]}
         
         # Generate description using ticket generator
         description = self.ticket_generator.generate_description(
-            ticket_type=ticket_type,
-            feature_name=epic['epic_name'],
-            **details
+            ticket_type, details, feature_name=feature_name
         )
         
         # Build complete ticket
         ticket = {
             "type": "Story",
-            "summary": ticket_spec['summary'],
+            "summary": ticket_spec.summary,
             "description": description,
-            "priority": ticket_spec.get('priority', 'High')
+            "priority": ticket_spec.priority
         }
         
         return ticket
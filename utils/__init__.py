@@ -0,0 +1,8 @@
+"""
+JIRA Automation Utilities
+Shared helpers for the VDB ticket generation scripts
+"""
+
+from .ticket_generator import PRIORITY_TABLE, Ticket, TicketGenerator
+
+__all__ = ["PRIORITY_TABLE", "Ticket", "TicketGenerator"]
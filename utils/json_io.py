@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+JSON I/O Helpers
+Read and write ticket batches with orjson when it is installed, stdlib json otherwise
+"""
+
+import json
+import functools
+import dataclasses
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# Where generated ticket batches are written
+OUTPUT_DIR = Path("/mnt/user-data/outputs")
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(directory: Path) -> Path:
+    """Create directory (once per process) and return it"""
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def output_path(filename: str) -> Path:
+    """Path for filename inside OUTPUT_DIR, creating the directory if needed"""
+    return _ensure_dir(OUTPUT_DIR) / filename
+
+
+def _default(obj):
+    """Serialize dataclass records (e.g. Ticket) as plain dicts"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data, compact: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON, indented by 2 spaces unless compact"""
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False,
+                          default=_default).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def write_json(path, data, compact: bool = False):
+    """Write data to a JSON file with a single write"""
+    Path(path).write_bytes(dumps_json(data, compact))
+
+
+def read_json(path):
+    """Parse a JSON file, handing its raw bytes straight to the parser"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _indented(data, level: int) -> bytes:
+    """Serialize data, indenting every line after the first by `level` spaces"""
+    return dumps_json(data).replace(b"\n", b"\n" + b" " * level)
+
+
+def write_json_records(path, head: dict, key: str, records, tail: dict = None):
+    """
+    Write {**head, key: [*records], **tail} as indented JSON, streaming the records
+    
+    Each record is serialized and written on its own, so the full document is
+    never held in memory. Output matches write_json for the same data.
+    """
+    with open(path, 'wb') as f:
+        f.write(b"{")
+        for name, value in head.items():
+            f.write(b"\n  " + dumps_json(name) + b": " + _indented(value, 2) + b",")
+        
+        f.write(b"\n  " + dumps_json(key) + b": [")
+        empty = True
+        for record in records:
+            f.write((b"\n    " if empty else b",\n    ") + _indented(record, 4))
+            empty = False
+        f.write(b"]" if empty else b"\n  ]")
+        
+        for name, value in (tail or {}).items():
+            f.write(b",\n  " + dumps_json(name) + b": " + _indented(value, 2))
+        f.write(b"\n}")
@@ -4,20 +4,185 @@ JIRA Ticket Generator Utility
 Generates JIRA tickets based on VDB project standards
 """
 
-import json
+import os
 import re
+import functools
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from .json_io import read_json
+except ImportError:  # run directly as a script from utils/
+    from json_io import read_json
+
+# Maximum number of generated texts kept per TicketGenerator instance
+CACHE_SIZE = 512
+
+# Default priority for each ticket type (core feature stories are High)
+PRIORITY_TABLE = {
+    "view_table_data": "High",
+    "add_entity": "High",
+    "perform_actions": "High",
+    "search_filter": "Medium",
+    "download": "Medium",
+    "upload_csv": "Medium",
+    "backend_architecture": "High",
+    "rbac_permissions": "High",
+    "nav_menu": "High",
+    "edge_cases": "Medium",
+    "generic_story": "Medium",
+}
+
+# Scopes that get a "FE: "/"BE: " summary prefix
+SCOPE_PREFIXES = frozenset({"FE", "BE"})
+
+# Fully static descriptions
+BACKEND_ARCHITECTURE_DESCRIPTION = """**Acceptance criteria:**
+
+Create following:
+
+* Model for database
+* Service
+* Entity
+* Controller
+* Routes
+"""
+
+GENERIC_DESCRIPTION = """**Acceptance criteria:**
+
+<Description of what the user should be able to do>
+
+---
+
+### Important Notes
+
+* <Note 1>
+* <Note 2>
+"""
+
+# Placeholder sections for tickets whose details weren't specified
+DEFAULT_COLUMNS_TEXT = "1. <Column 1> (<Format>)\n2. <Column 2> (<Format>)\n3. <Column 3>"
+
+DEFAULT_FIELDS_TEXT = """* <Field 1> * (Type: <Type>. Default: <Default>)
+* <Field 2> * (Type: <Type>)
+* <Field 3> (Type: <Type>. Mandatory only when <Condition>)
+* <Comments/Notes> (Type: Large expandable text. <Mandatory/Optional>)"""
+
+DEFAULT_PERMISSIONS_LIST = "* <Permission 1>\n* <Permission 2>"
+
+DEFAULT_PERMISSIONS_DETAILS = """**<Permission 1>**: EDIT of this should allow the user to <actions>. VIEW access should only allow <read actions>.
+
+**<Permission 2>**: EDIT of this should allow <actions>. VIEW access should allow <read actions>."""
+
+DEFAULT_FILTERS_TEXT = """1. <Filter 1> (by default <Default>)
+2. <Filter 2> (by default <Default>)
+3. <Filter 3> (by default <Default>)"""
+
+# Context words that make any ticket Highest priority (matched anywhere, like "debug")
+HIGHEST_PRIORITY_RE = re.compile(r"demo|blocker|critical|bug|urgent", re.IGNORECASE)
+
+# Description phrases identifying each ticket type, in precedence order
+TICKET_TYPE_RE = re.compile(
+    r"(?P<view_table_data>user should be able to access and view data in the table)"
+    r"|(?P<add_entity>user should be able to add)"
+    r"|(?P<perform_actions>user should be able to perform actions)"
+    r"|(?P<search_filter>user should be able to search and filter|user should be able to filter)"
+    r"|(?P<download>user should be able to download)"
+    r"|(?P<upload_csv>user should be able to upload)"
+    r"|(?P<backend_architecture>implement backend architecture)"
+    r"|(?P<rbac_permissions>adding rbac|permissions related to)"
+    r"|(?P<nav_menu>user should be able to view a new menu)"
+    r"|(?P<edge_cases>handling deleted data|edge case)",
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
+class Ticket:
+    """A generated ticket, ready for batch export"""
+    type: str
+    summary: str
+    description: str
+    priority: str
+
+
+@functools.lru_cache(maxsize=8)
+def _load_historical_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a historical data file; keyed on mtime so edits are picked up"""
+    return read_json(path)
+
+
+def _freeze(value):
+    """Convert lists/dicts into type-tagged nested tuples so they can be used as cache keys"""
+    # Tag each value with its type so True/1/1.0 and [x]/(x,) get distinct keys
+    if isinstance(value, dict):
+        return (type(value), tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _memoize(method):
+    """Cache a generator method's result on the instance, keyed by its arguments"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = (method.__name__, _freeze(args), _freeze(kwargs))
+            return self._cache[key]
+        except TypeError:
+            # Unhashable argument - skip the cache
+            return method(self, *args, **kwargs)
+        except KeyError:
+            pass
+        
+        result = method(self, *args, **kwargs)
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = result
+        return result
+    return wrapper
+
+
 class TicketGenerator:
     """Generate JIRA tickets following VDB project standards"""
     
+    # (ticket type, priority) of the standard epic-level and per-tab tickets, in creation order
+    _EPIC_SPECS = (("backend_architecture", "High"), ("rbac_permissions", "High"), ("nav_menu", "High"))
+    _TAB_SPECS = (("view_table_data", "High"), ("search_filter", "High"))
+    
+    # str.format summary templates by ticket type, filled in by generate_summary
+    _SUMMARY_TEMPLATES = {
+        "view_table_data": "User should be able to access and view data in the table of '{tab}' tab",
+        "add_entity": "User should be able to add a {entity} by clicking on \"+ {entity_cta}\" CTA",
+        "perform_actions": "User should be able to perform actions on {entities} in '{tab}' tab",
+        "search_filter": "User should be able to Search and Filter data in '{tab}' tab",
+        "download": "User should be able to download all the records in \"{feature}\" feature",
+        "upload_csv": "User should be able to upload data in bulk in \"{feature}\" feature",
+        "backend_architecture": "BE: Implement backend architecture of \"{feature}\"",
+        "rbac_permissions": "Adding RBAC permissions related to \"{feature}\" in Permission tab of Administration menu",
+        "nav_menu": "FE: User should be able to view a new menu \"{feature}\" under \"Clinical\" in nav panel",
+        "edge_cases": "Handling deleted data edge cases in {feature}",
+    }
+    
     def __init__(self, standards_path: str = None, historical_data_path: str = None):
         """Initialize with standards and historical data"""
         self.standards_path = standards_path
         self.historical_data_path = historical_data_path
         self.standards = self._load_standards() if standards_path else {}
-        self.historical_data = self._load_historical_data() if historical_data_path else {}
-        
+        self._historical_data = None  # Loaded on first access
+        self._cache = {}
+    
+    @property
+    def historical_data(self) -> dict:
+        """Historical ticket data, read from historical_data_path on first use"""
+        if self._historical_data is None:
+            self._historical_data = self._load_historical_data()
+        return self._historical_data
+    
+    @historical_data.setter
+    def historical_data(self, value: dict):
+        self._historical_data = value
+    
     def _load_standards(self) -> dict:
         """Load standards from markdown file"""
         # This would parse the standards markdown
@@ -29,105 +194,67 @@ class TicketGenerator:
         if not self.historical_data_path:
             return {}
         try:
-            with open(self.historical_data_path, 'r') as f:
-                return json.load(f)
+            mtime_ns = os.stat(self.historical_data_path).st_mtime_ns
         except FileNotFoundError:
             return {}
+        return _load_historical_cached(self.historical_data_path, mtime_ns)
     
     def detect_ticket_type(self, description: str) -> str:
         """Detect the type of ticket based on description patterns"""
-        description_lower = description.lower()
+        # One scan; the earliest-listed type found anywhere wins
+        best = None
+        for match in TICKET_TYPE_RE.finditer(description):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
         
-        # Pattern matching
-        if "user should be able to access and view data in the table" in description_lower:
-            return "view_table_data"
-        elif "user should be able to add" in description_lower:
-            return "add_entity"
-        elif "user should be able to perform actions" in description_lower:
-            return "perform_actions"
-        elif "user should be able to search and filter" in description_lower or "user should be able to filter" in description_lower:
-            return "search_filter"
-        elif "user should be able to download" in description_lower:
-            return "download"
-        elif "user should be able to upload" in description_lower:
-            return "upload_csv"
-        elif "implement backend architecture" in description_lower:
-            return "backend_architecture"
-        elif "adding rbac" in description_lower or "permissions related to" in description_lower:
-            return "rbac_permissions"
-        elif "user should be able to view a new menu" in description_lower:
-            return "nav_menu"
-        elif "handling deleted data" in description_lower or "edge case" in description_lower:
-            return "edge_cases"
-        else:
-            return "generic_story"
+        return best.lastgroup if best else "generic_story"
     
+    @_memoize
     def generate_summary(self, ticket_type: str, feature_name: str, 
                         tab_name: str = None, entity_name: str = None,
                         scope: str = None) -> str:
         """Generate ticket summary based on type and parameters"""
         
-        templates = {
-            "view_table_data": f"User should be able to access and view data in the table of '{tab_name or feature_name}' tab",
-            "add_entity": f"User should be able to add a {entity_name or 'record'} by clicking on \"+ {entity_name or 'Add'}\" CTA",
-            "perform_actions": f"User should be able to perform actions on {entity_name or 'records'} in '{tab_name or feature_name}' tab",
-            "search_filter": f"User should be able to Search and Filter data in '{tab_name or feature_name}' tab",
-            "download": f"User should be able to download all the records in \"{feature_name}\" feature",
-            "upload_csv": f"User should be able to upload data in bulk in \"{feature_name}\" feature",
-            "backend_architecture": f"BE: Implement backend architecture of \"{feature_name}\"",
-            "rbac_permissions": f"Adding RBAC permissions related to \"{feature_name}\" in Permission tab of Administration menu",
-            "nav_menu": f"FE: User should be able to view a new menu \"{feature_name}\" under \"Clinical\" in nav panel",
-            "edge_cases": f"Handling deleted data edge cases in {feature_name}",
-        }
-        
-        summary = templates.get(ticket_type, f"User should be able to {feature_name}")
+        # Only the selected template is formatted
+        summary = self._SUMMARY_TEMPLATES.get(ticket_type, "User should be able to {feature}").format(
+            feature=feature_name,
+            tab=tab_name or feature_name,
+            entity=entity_name or "record",
+            entity_cta=entity_name or "Add",
+            entities=entity_name or "records"
+        )
         
         # Add scope prefix if specified
-        if scope and scope.upper() in ["FE", "BE"]:
-            if not summary.startswith(scope.upper() + ":"):
-                summary = f"{scope.upper()}: {summary}"
+        if scope:
+            prefix = scope.upper()
+            if prefix in SCOPE_PREFIXES and not summary.startswith(prefix + ":"):
+                summary = f"{prefix}: {summary}"
         
         return summary
     
-    def generate_description(self, ticket_type: str, **kwargs) -> str:
-        """Generate ticket description based on type"""
-        
-        if ticket_type == "backend_architecture":
-            return self._template_backend_architecture(**kwargs)
-        elif ticket_type == "view_table_data":
-            return self._template_view_table_data(**kwargs)
-        elif ticket_type == "add_entity":
-            return self._template_add_entity(**kwargs)
-        elif ticket_type == "rbac_permissions":
-            return self._template_rbac_permissions(**kwargs)
-        elif ticket_type == "search_filter":
-            return self._template_search_filter(**kwargs)
-        else:
-            return self._template_generic(**kwargs)
+    @_memoize
+    def generate_description(self, ticket_type: str, params: Optional[Dict] = None, **kwargs) -> str:
+        """Generate ticket description based on type, from params and/or keyword arguments"""
+        if params:
+            kwargs = {**params, **kwargs} if kwargs else params
+        template = self._DESCRIPTION_TEMPLATES.get(ticket_type, TicketGenerator._template_generic)
+        return template(self, **kwargs)
     
     def _template_backend_architecture(self, feature_name: str = "", **kwargs) -> str:
         """Generate backend architecture ticket description"""
-        return f"""**Acceptance criteria:**
-
-Create following:
-
-* Model for database
-* Service
-* Entity
-* Controller
-* Routes
-"""
+        return BACKEND_ARCHITECTURE_DESCRIPTION
     
     def _template_view_table_data(self, feature_name: str = "", 
                                   tab_name: str = "", columns: List[str] = None,
                                   facility_scope: str = "facility-specific", **kwargs) -> str:
         """Generate view table data ticket description"""
         
-        columns_text = ""
         if columns:
-            columns_text = "\n".join([f"{i+1}. {col}" for i, col in enumerate(columns)])
+            columns_text = "\n".join(f"{i}. {col}" for i, col in enumerate(columns, 1))
         else:
-            columns_text = "1. <Column 1> (<Format>)\n2. <Column 2> (<Format>)\n3. <Column 3>"
+            columns_text = DEFAULT_COLUMNS_TEXT
         
         return f"""User should be able to access and view data in the table of '{tab_name or feature_name}' tab.
 
@@ -153,19 +280,15 @@ The table should have the following columns:
                             facility_scope: str = "facility-specific", **kwargs) -> str:
         """Generate add entity ticket description"""
         
-        fields_text = ""
         if fields:
+            lines = []
             for field in fields:
                 mandatory = "*" if field.get("mandatory", False) else ""
-                fields_text += f"* {field['name']} {mandatory} (Type: {field.get('type', 'Text field')}. "
-                if field.get("default"):
-                    fields_text += f"Default: {field['default']}. "
-                fields_text += ")\n"
+                default = f"Default: {field['default']}. " if field.get("default") else ""
+                lines.append(f"* {field['name']} {mandatory} (Type: {field.get('type', 'Text field')}. {default})\n")
+            fields_text = "".join(lines)
         else:
-            fields_text = """* <Field 1> * (Type: <Type>. Default: <Default>)
-* <Field 2> * (Type: <Type>)
-* <Field 3> (Type: <Type>. Mandatory only when <Condition>)
-* <Comments/Notes> (Type: Large expandable text. <Mandatory/Optional>)"""
+            fields_text = DEFAULT_FIELDS_TEXT
         
         return f"""User should be able to add a {entity_name} by clicking on "+ {entity_name.capitalize()}" CTA that will open a modal with fields:
 
@@ -194,8 +317,6 @@ The table should have the following columns:
                                    permissions: List[str] = None, **kwargs) -> str:
         """Generate RBAC permissions ticket description"""
         
-        perms_list = ""
-        perms_details = ""
         if permissions:
             perms_list = "\n".join([f"* {perm}" for perm in permissions])
             perms_details = "\n\n".join([
@@ -203,10 +324,8 @@ The table should have the following columns:
                 for perm in permissions
             ])
         else:
-            perms_list = "* <Permission 1>\n* <Permission 2>"
-            perms_details = """**<Permission 1>**: EDIT of this should allow the user to <actions>. VIEW access should only allow <read actions>.
-
-**<Permission 2>**: EDIT of this should allow <actions>. VIEW access should allow <read actions>."""
+            perms_list = DEFAULT_PERMISSIONS_LIST
+            perms_details = DEFAULT_PERMISSIONS_DETAILS
         
         return f"""Add RBAC permissions related to "{feature_name}" in Permission tab of Administration menu under the <Sub-tab> sub-tab.
 
@@ -237,14 +356,13 @@ Under <Sub-tab>, there should be a heading of {feature_name} with the following
         if search_fields:
             search_text = f"User should be able to perform Search on {', '.join(search_fields)}. Implement Fuzzy Logic"
         
-        filters_text = ""
         if filters:
-            for i, f in enumerate(filters, 1):
-                filters_text += f"{i}. {f['name']} ({f.get('type', 'Dropdown')}, by default {f.get('default', 'All')})\n"
+            filters_text = "".join(
+                f"{i}. {f['name']} ({f.get('type', 'Dropdown')}, by default {f.get('default', 'All')})\n"
+                for i, f in enumerate(filters, 1)
+            )
         else:
-            filters_text = """1. <Filter 1> (by default <Default>)
-2. <Filter 2> (by default <Default>)
-3. <Filter 3> (by default <Default>)"""
+            filters_text = DEFAULT_FILTERS_TEXT
         
         return f"""User should be able to filter the records in table of {tab_name or feature_name}. 
 
@@ -275,32 +393,26 @@ User should be able to click on the Filters CTA and access filters drawer and ap
     
     def _template_generic(self, **kwargs) -> str:
         """Generate generic ticket description"""
-        return """**Acceptance criteria:**
-
-<Description of what the user should be able to do>
-
----
-
-### Important Notes
-
-* <Note 1>
-* <Note 2>
-"""
+        return GENERIC_DESCRIPTION
+    
+    # Description template for each ticket type; other types use _template_generic
+    _DESCRIPTION_TEMPLATES = {
+        "backend_architecture": _template_backend_architecture,
+        "view_table_data": _template_view_table_data,
+        "add_entity": _template_add_entity,
+        "rbac_permissions": _template_rbac_permissions,
+        "search_filter": _template_search_filter,
+    }
     
+    @_memoize
     def suggest_priority(self, ticket_type: str, context: str = "") -> str:
         """Suggest priority based on ticket type and context"""
-        context_lower = context.lower()
-        
         # Highest priority indicators
-        if any(word in context_lower for word in ["demo", "blocker", "critical", "bug", "urgent"]):
+        if HIGHEST_PRIORITY_RE.search(context):
             return "Highest"
         
-        # High priority for core feature stories
-        if ticket_type in ["view_table_data", "add_entity", "perform_actions", "backend_architecture", "nav_menu", "rbac_permissions"]:
-            return "High"
-        
-        # Medium for supporting features
-        return "Medium"
+        # High for core feature stories, Medium for supporting features
+        return PRIORITY_TABLE.get(ticket_type, "Medium")
     
     def create_ticket(self, issue_type: str, summary: str, description: str,
                      priority: str = "Medium", epic_key: str = None) -> Dict:
@@ -325,66 +437,27 @@ User should be able to click on the Filters CTA and access filters drawer and ap
                              include_backend: bool = True,
                              include_rbac: bool = True,
                              include_nav: bool = True,
-                             tabs: List[str] = None) -> List[Dict]:
+                             tabs: List[str] = None) -> List[Ticket]:
         """Generate standard set of tickets for a new epic"""
         
         tickets = []
+        summarize = self.generate_summary
+        describe = self.generate_description
         
-        # 1. Backend Architecture (if requested)
-        if include_backend:
-            summary = self.generate_summary("backend_architecture", epic_name)
-            description = self.generate_description("backend_architecture", feature_name=epic_name)
-            tickets.append({
-                "type": "Story",
-                "summary": summary,
-                "description": description,
-                "priority": "High"
-            })
-        
-        # 2. RBAC Permissions (if requested)
-        if include_rbac:
-            summary = self.generate_summary("rbac_permissions", epic_name)
-            description = self.generate_description("rbac_permissions", feature_name=epic_name)
-            tickets.append({
-                "type": "Story",
-                "summary": summary,
-                "description": description,
-                "priority": "High"
-            })
-        
-        # 3. Navigation Menu (if requested)
-        if include_nav:
-            summary = self.generate_summary("nav_menu", epic_name)
-            description = self._template_generic()
-            tickets.append({
-                "type": "Story",
-                "summary": summary,
-                "description": description,
-                "priority": "High"
-            })
+        # Backend architecture, RBAC permissions and nav menu (each if requested)
+        included = (include_backend, include_rbac, include_nav)
+        for (ticket_type, priority), include in zip(self._EPIC_SPECS, included):
+            if include:
+                summary = summarize(ticket_type, epic_name)
+                description = describe(ticket_type, feature_name=epic_name)
+                tickets.append(Ticket("Story", summary, description, priority))
         
-        # 4. Tab-specific tickets
-        if tabs:
-            for tab in tabs:
-                # View table data
-                summary = self.generate_summary("view_table_data", epic_name, tab_name=tab)
-                description = self.generate_description("view_table_data", tab_name=tab)
-                tickets.append({
-                    "type": "Story",
-                    "summary": summary,
-                    "description": description,
-                    "priority": "High"
-                })
-                
-                # Search and filter
-                summary = self.generate_summary("search_filter", epic_name, tab_name=tab)
-                description = self.generate_description("search_filter", tab_name=tab)
-                tickets.append({
-                    "type": "Story",
-                    "summary": summary,
-                    "description": description,
-                    "priority": "High"
-                })
+        # Tab-specific tickets
+        for tab in tabs or ():
+            for ticket_type, priority in self._TAB_SPECS:
+                summary = summarize(ticket_type, epic_name, tab_name=tab)
+                description = describe(ticket_type, tab_name=tab)
+                tickets.append(Ticket("Story", summary, description, priority))
         
         return tickets
 